@@ -0,0 +1,483 @@
+"""Interactive `Grid` demos.
+
+Usage: python examples/grid_demo.py [N ...]; runs `mainN` for each N (default 5).
+Set LIBCURSES_QUIET=1 to disable logging, e.g., when timing the demos.
+"""
+
+import curses
+import os
+import sys
+import weakref
+
+from loguru import logger
+
+import libcurses
+from libcurses.grid import Grid
+
+# -------------------------------------------------------------------------------
+
+
+# (boxname, nlines, ncols, begin_y, begin_x); negative begin_y/begin_x are
+# measured from the bottom/right edge of the window.
+BOXES_MAIN1 = (
+    ("1", 5, 5, 3, 3),
+    ("2", 3, 3, 0, -3),
+    ("3", 3, 3, -4, -4),  # problem
+    ("4", 3, 3, -5, 2),
+    #
+    ("5", 5, 10, 2, 20),
+    ("6", 5, 10, 4, 20),
+    ("7", 5, 10, 2, 40),
+    ("8", 5, 10, 5, 40),  # problem
+    ("9", 5, 10, 2, 60),
+    ("10", 5, 10, 6, 60),
+    ("11", 5, 10, 2, 80),
+    ("12", 5, 10, 7, 80),  # problem
+    ("13", 5, 10, 2, 100),
+    ("14", 5, 10, 8, 100),
+    #
+    ("15", 3, 5, 20, 4),
+    ("16", 3, 5, 20, 8),
+    ("17", 3, 5, 20, 12),
+    ("18", 3, 5, 20, 20),
+    ("19", 3, 5, 20, 23),
+    ("20", 3, 5, 20, 26),  # problem
+    ("21", 3, 5, 20, 36),
+    ("22", 3, 5, 20, 40),
+    ("23", 3, 5, 20, 44),
+    ("24", 3, 5, 20, 52),
+    ("25", 3, 5, 20, 57),
+    ("26", 3, 5, 20, 62),  # problem
+    ("27", 3, 5, 20, 68),
+    ("28", 3, 5, 20, 72),
+    ("29", 3, 5, 20, 76),
+)
+
+
+def main1(win: curses.window) -> None:
+
+    win.erase()
+    nlines, ncols = win.getmaxyx()
+    grid = Grid(win)
+    for boxname, _nlines, _ncols, begin_y, begin_x in BOXES_MAIN1:
+        if begin_y < 0:
+            begin_y += nlines
+        if begin_x < 0:
+            begin_x += ncols
+        grid.box(boxname, _nlines, _ncols, begin_y=begin_y, begin_x=begin_x)
+
+    prompt(grid, win)
+    curses.endwin()
+
+
+# -------------------------------------------------------------------------------
+
+
+# (boxname, nlines, ncols, begin_y, begin_x)
+BOXES_MAIN3 = (
+    ("a", 5, 10, 0, 0),
+    ("b", 5, 10, 0, 9),
+    ("c", 5, 10, 0, 18),
+    #
+    ("d", 5, 10, 4, 0),
+    ("e", 5, 10, 4, 9),
+    ("f", 5, 10, 4, 18),
+    #
+    ("g", 5, 10, 8, 0),
+    ("h", 5, 10, 8, 9),
+    ("i", 5, 10, 8, 18),
+)
+
+
+def main3(win: curses.window) -> None:
+
+    #    0----+----1----+----2----+----3
+    #  0 +--------+--------+--------+
+    #  1 |        |        |        |
+    #  2 |12345678|12345678|12345678|
+    #  3 |        |        |        |
+    #  4 +--------+--------+--------+
+    #  5 |        |        |        |
+    #  6 |12345678|12345678|12345678|
+    #  7 |        |        |        |
+    #  8 +--------+--------+--------+
+    #  9 |        |        |        |
+    # 10 |12345678|12345678|12345678|
+    # 11 |        |        |        |
+    # 12 +--------+--------+--------+
+
+    win.erase()
+    grid = Grid(win)
+    for boxname, nlines, ncols, begin_y, begin_x in BOXES_MAIN3:
+        grid.box(boxname, nlines, ncols, begin_y=begin_y, begin_x=begin_x)
+
+    for idx, w in enumerate(grid.boxes):
+        w.addstr(str(idx))
+
+    prompt(grid, win)
+    curses.endwin()
+
+
+# -------------------------------------------------------------------------------
+
+
+def main4(win: curses.window) -> None:
+
+    _, c2, c3 = setup_test(win)
+
+    _test_backgrounds(win, c2, c3, msg="win")
+
+    nlines, ncols = win.getmaxyx()
+    dims = [(i, nlines - 2 * i, ncols - 2 * i) for i in range(0, 10, 2)]
+    for i, _nlines, _ncols in dims:
+        logger.success("iteration {}", i)
+        win = curses.newwin(_nlines, _ncols, i, i)
+        _test_backgrounds(win, c2, c3, msg=f"i={i}")
+        grid = Grid(win)
+        _test_outside_ltor_ttob(grid)
+        _test_outside_rtol_btot(grid)
+        _test_outside_plus(grid)
+        prompt(grid, win, msg=f"i={i} bkgd default {grid}")
+
+    curses.endwin()
+
+
+# -------------------------------------------------------------------------------
+
+
+def main5(win: curses.window) -> None:
+
+    # pylint: disable=too-many-locals
+
+    _, c2, c3 = setup_test(win)
+
+    grid = Grid(win, bkgd_grid=(ord("+"), c2), bkgd_box=(ord("."), c3))
+    # grid = Grid(win, bkgd_grid=('.', c2))
+    # grid = Grid(win, bkgd_grid=('.', c3))
+    # grid = Grid(win, bkgd_box=('.', c2))
+    # grid = Grid(win, bkgd_box=('.', c3))
+    # grid = Grid(win)
+
+    # check screen size!! 36x146
+
+    _test_crossing_x = False
+    if _test_crossing_x:
+        for i in range(0, 18, 2):
+            grid.box(
+                f"{i}:ul", nlines=4, ncols=5, begin_y=2 * i, begin_x=3 * i, left=grid, top=grid
+            )
+            grid.box(
+                f"{i}:ur", nlines=4, ncols=5, begin_y=2 * i, begin_x=-3 * i, right=grid, top=grid
+            )
+            grid.box(
+                f"{i}:lr",
+                nlines=4,
+                ncols=5,
+                begin_y=-2 * i,
+                begin_x=-3 * i,
+                right=grid,
+                bottom=grid,
+            )
+            grid.box(
+                f"{i}:ll",
+                nlines=4,
+                ncols=5,
+                begin_y=-2 * i,
+                begin_x=3 * i,
+                left=grid,
+                bottom=grid,
+            )
+            prompt(grid, win)
+        curses.endwin()
+        return
+
+    _test_corners = True
+    if _test_corners:
+        # corners
+        ul = grid.box("ul", 5, 20, top=grid, left=grid)
+        ur = grid.box("ur", 5, 20, top=grid, right=grid)
+        lr = grid.box("lr", 5, 20, right=grid, bottom=grid)
+        ll = grid.box("ll", 5, 20, bottom=grid, left=grid)
+        prompt(grid, win)
+
+    _test_fillers_none_to_grid = True
+    if _test_fillers_none_to_grid:
+        # fillers, none to grid
+        # pylint: disable=possibly-used-before-assignment
+        tf = grid.box("tf", 5, 0, top=grid, right2l=ur, bottom=None, left2r=ul)
+        rf = grid.box("rf", 0, 20, top2b=ur, right=grid, bottom2t=lr, left2r=None)
+        bf = grid.box("bf", 5, 0, top2b=None, right2l=lr, bottom=grid, left2r=ll)
+        lf = grid.box("lf", 0, 20, top2b=ul, right2l=None, bottom2t=ll, left=grid)
+        prompt(grid, win)
+
+    for i in range(0, 14, 2):
+        grid.box(f"{i}:ul", nlines=4, ncols=5, begin_y=2 * i, begin_x=3 * i, left2r=lf, top2b=tf)
+        grid.box(
+            f"{i}:ur", nlines=4, ncols=5, begin_y=2 * i, begin_x=-3 * i, right2l=rf, top2b=tf
+        )
+        grid.box(
+            f"{i}:lr",
+            nlines=4,
+            ncols=5,
+            begin_y=-2 * i,
+            begin_x=-3 * i,
+            right2l=rf,
+            bottom2t=bf,
+        )
+        grid.box(
+            f"{i}:ll",
+            nlines=4,
+            ncols=5,
+            begin_y=-2 * i,
+            begin_x=3 * i,
+            left2r=lf,
+            bottom2t=bf,
+        )
+    prompt(grid, win, "check screen size!! 36x146")
+    curses.endwin()
+
+
+# -------------------------------------------------------------------------------
+
+
+def main6(win: curses.window) -> None:
+
+    _, c2, c3 = setup_test(win)
+
+    grid = Grid(win, bkgd_grid=(ord("+"), c2), bkgd_box=(ord("."), c3))
+
+    top = grid.box("hsplit-top", 5, 0, left=grid, right=grid, top=grid)
+    grid.box("hsplit-bot", 0, 0, left=grid, right=grid, top2b=top, bottom=grid)
+    prompt(grid, win)
+
+    bot = grid.box("hsplit-bot", 5, 0, left=grid, right=grid, bottom=grid)
+    grid.box("hsplit-top", 0, 0, left=grid, right=grid, bottom2t=bot, top=grid)
+    prompt(grid, win)
+
+    left = grid.box("vsplit-left", 0, 20, left=grid, top=grid, bottom=grid)
+    grid.box("vsplit-right", 0, 0, left2r=left, right=grid, top=grid, bottom=grid)
+    prompt(grid, win)
+
+    right = grid.box("vsplit-right", 0, 20, right=grid, top=grid, bottom=grid)
+    grid.box("vsplit-left", 0, 0, left=grid, right2l=right, top=grid, bottom=grid)
+    prompt(grid, win)
+
+
+# -------------------------------------------------------------------------------
+
+
+_COLORS: tuple[int, int, int] | None = None  # initialized once by `setup_test`.
+
+
+def setup_test(win: curses.window) -> tuple[int, int, int]:
+
+    global _COLORS  # noqa
+    if _COLORS is None:
+        #                   fg                  bg
+        curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_RED)
+        curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+        curses.init_pair(3, curses.COLOR_BLUE, curses.COLOR_WHITE)
+        _COLORS = curses.color_pair(1), curses.color_pair(2), curses.color_pair(3)
+
+    c1, c2, c3 = _COLORS
+    win.erase()
+    win.bkgd(ord("*"), c1)
+    # prompt(None, win, msg=f'win setup {winyx(win)}')
+    return c1, c2, c3
+
+
+# -------------------------------------------------------------------------------
+
+
+def _test_backgrounds(win: curses.window, c2: int, c3: int, msg: str) -> None:
+
+    grid = Grid(win)
+    _test_outside_ltor_ttob(grid)
+    _test_outside_rtol_btot(grid)
+    _test_outside_plus(grid)
+    prompt(grid, win, msg=f"{msg} bkgd default {grid}")
+
+    # same layout, different backgrounds; replay it rather than resolve it again.
+    layout = _get_layout(grid)
+
+    for name, bkgd_grid, bkgd_box in [
+        ("bkgd_box", None, (ord("."), c3)),
+        ("bkgd_grid", (ord("."), c2), None),
+        ("bkgd_box bkgd_grid", (ord("."), c2), (ord("."), c3)),
+    ]:
+        grid.reset(bkgd_grid=bkgd_grid, bkgd_box=bkgd_box)
+        for boxname, nlines, ncols, begin_y, begin_x in layout:
+            grid.box(boxname, nlines, ncols, begin_y=begin_y, begin_x=begin_x)
+        prompt(grid, win, msg=f"{msg} {name} {grid}")
+
+
+def _get_layout(grid: Grid) -> list[tuple[str, int, int, int, int]]:
+    """Return (boxname, nlines, ncols, begin_y, begin_x) of each box on `grid`.
+
+    A box re-placed by name is on `grid.boxes` once per placement; keep the
+    repeats, so the replay rebuilds the same list (and `prompt` labels).
+    """
+
+    layout = []
+    for w in grid.boxes[1:]:
+        nlines, ncols = w.getmaxyx()
+        begin_y, begin_x = w.getbegyx()
+        layout.append((grid.boxnames[w], nlines + 2, ncols + 2, begin_y - 1, begin_x - 1))
+    return layout
+
+
+# -------------------------------------------------------------------------------
+#     +---+
+#     | t |
+# +---+---+---+
+# | l | c | r |
+# +---+---+---+
+#     | b |
+#     +---+
+
+
+def _test_outside_plus(grid: Grid, centered: bool = True) -> None:
+
+    if centered:
+        c = grid.box("c", 3, 5, begin_y=grid.nlines // 2 - 3, begin_x=grid.ncols // 2 - 3)
+    else:
+        c = grid.box("c", 3, 5, begin_y=2, begin_x=4)
+        c = grid.box("c", 3, 5, begin_y=3, begin_x=5)
+        c = grid.box("c", 3, 5, begin_y=4, begin_x=6)
+
+    _ = grid.box("t", 3, 5, bottom2t=c, left=c)
+    _ = grid.box("r", 3, 5, top=c, left2r=c)
+    _ = grid.box("b", 3, 5, top2b=c, left=c)
+    _ = grid.box("l", 3, 5, top=c, right2l=c)
+
+
+# -------------------------------------------------------------------------------
+# +---+---+---+
+# | a | b | c |
+# +---+---+---+
+# | d | e | f |
+# +---+---+---+
+# | g | h | i |
+# +---+---+---+
+
+
+def _test_outside_ltor_ttob(grid: Grid) -> None:
+
+    a = grid.box("a", 5, 10, top=grid, left=grid)
+    b = grid.box("b", 5, 10, top=a, left2r=a)
+    _ = grid.box("c", 5, 10, top=a, left2r=b)
+
+    d = grid.box("d", 5, 10, top2b=a, left=a)
+    e = grid.box("e", 5, 10, top2b=a, left2r=d)
+    _ = grid.box("f", 5, 10, top2b=a, left2r=e)
+
+    g = grid.box("g", 5, 10, top2b=d, left=d)
+    h = grid.box("h", 5, 10, top2b=d, left2r=g)
+    _ = grid.box("i", 5, 10, top2b=d, left2r=h)
+
+
+# -------------------------------------------------------------------------------
+# +---+---+---+
+# | i | h | g |
+# +---+---+---+
+# | f | e | d |
+# +---+---+---+
+# | c | b | a |
+# +---+---+---+
+
+
+def _test_outside_rtol_btot(grid: Grid) -> None:
+
+    a = grid.box("a", 5, 10, bottom=grid, right=grid)
+    b = grid.box("b", 5, 10, top=a, right2l=a)
+    _ = grid.box("c", 5, 10, top=a, right2l=b)
+
+    d = grid.box("d", 5, 10, bottom2t=a, right=grid)
+    e = grid.box("e", 5, 10, bottom2t=a, right2l=d)
+    _ = grid.box("f", 5, 10, bottom2t=a, right2l=e)
+
+    g = grid.box("g", 5, 10, bottom2t=d, right=grid)
+    h = grid.box("h", 5, 10, bottom2t=d, right2l=g)
+    _ = grid.box("i", 5, 10, bottom2t=d, right2l=h)
+
+
+# -------------------------------------------------------------------------------
+
+#
+# j = grid.box('j', 5, -10, right2l=win)
+# k = grid.box('k', 5, 10, right2l=j)
+# l = grid.box('l', 5, 10, right2l=k)
+
+#
+# m = grid.box('m', -5, -10, bottom2t=win, right2l=win)
+# n = grid.box('n', -5, 10, bottom2t=win, right2l=m)
+# o = grid.box('o', -5, 10, bottom2t=win, right2l=n)
+
+#
+# p = grid.box('p', -5, 10, bottom2t=win)
+# q = grid.box('q', -5, 10, bottom2t=win, left2r=p)
+# r = grid.box('r', -5, 10, bottom2t=win, left2r=q)
+
+# -------------------------------------------------------------------------------
+
+
+# key=grid, value=grid.generation when last labeled; forgets grids that are gone.
+_LABELED: weakref.WeakKeyDictionary[Grid, int] = weakref.WeakKeyDictionary()
+_LABELS: list[str] = []  # _LABELS[idx] == str(idx); grown on demand.
+
+
+def prompt(grid: Grid, win: curses.window, msg: str = "Press any key to continue") -> None:
+
+    # win.erase()
+
+    if grid:
+        # boxes keep their labels; write them only if boxes have changed.
+        if _LABELED.get(grid) != grid.generation:
+            _LABELED[grid] = grid.generation
+            if len(_LABELS) < len(grid.boxes):
+                _LABELS.extend(str(idx) for idx in range(len(_LABELS), len(grid.boxes)))
+            for label, w in zip(_LABELS, grid.boxes):
+                # overwrite any old label; unlike `addstr`, `insstr` doesn't
+                # move the cursor, so it can't fail in the last column.
+                for _ in label:
+                    w.delch(0, 0)
+                w.insstr(0, 0, label)
+
+        # leave the update to `getkey`; one burst of output, not two.
+        grid.redraw(update=False)
+
+    win = grid.win
+    win.addstr(grid.nlines - 6, 20, msg)
+    while libcurses.getkey(win) == curses.KEY_RESIZE:
+        # coalesce a burst of resize events into one.
+        win.nodelay(True)
+        while (key := win.getch()) == curses.KEY_RESIZE:
+            pass
+        win.nodelay(False)
+        if key != curses.ERR:
+            curses.ungetch(key)  # not a resize; leave it for `getkey`.
+        curses.update_lines_cols()
+        logger.success("resized!")
+
+
+# -------------------------------------------------------------------------------
+
+MAINS = {1: main1, 3: main3, 4: main4, 5: main5, 6: main6}
+
+
+def run_mains(win: curses.window) -> None:
+    """Run each `mainN` named on the command line (default 5) in one session."""
+
+    for n in sys.argv[1:] or ["5"]:
+        MAINS[int(n)](win)
+
+
+if __name__ == "__main__":
+    if os.environ.get("LIBCURSES_QUIET"):
+        # without sinks, loguru drops each record before formatting it.
+        logger.remove()
+    # logger.remove(0)
+    # logger.add(sys.stderr,
+    #            format="{level} {function} {line} {message}",
+    #            colorize=True, level='TRACE')
+    libcurses.wrapper(run_mains)
@@ -1,13 +1,15 @@
+"""Interactive mouse demo.
+
+Usage: python examples/mouse_demo.py; drag the borders between boxes to
+resize them, type lines into the upper-left box, and ^D to exit.
+"""
+
 import curses
 
 import libcurses
 from libcurses.grid import Grid
 
 
-def test_stub() -> None:
-    """Make pytest happy to have a test to run, or pytest will exit non-zero."""
-
-
 def _test_mouse(win: curses.window) -> None:
     """Docstring."""
 
@@ -25,6 +25,14 @@ CharAttr = tuple[int, int] | None
 # A callback to add boxes to an empty grid.
 GridBuilder = Callable[[], None]
 
+# Keys that exit Resize Mode.
+_RESIZE_EXIT_KEYS = frozenset(
+    (curses.ascii.LF, curses.ascii.CR, curses.ascii.ESC, curses.KEY_ENTER)
+)
+
+# Mask to strip the color-pair from a character/attribute word.
+_NOT_A_COLOR = ~curses.A_COLOR
+
 # -------------------------------------------------------------------------------
 
 
@@ -110,6 +118,8 @@ class Grid:
     # -------------------------------------------------------------------------------
 
     _borders: dict[int, int]
+    _vline: int  # curses.ACS_VLINE, less color.
+    _hline: int  # curses.ACS_HLINE, less color.
     _init_called = False
 
     @classmethod
@@ -162,6 +172,10 @@ class Grid:
             cls.N.L | cls.N.B | cls.N.R | cls.N.T: curses.ACS_PLUS,
         }
 
+        # the ACS_* values are not available until after `curses.initscr`.
+        cls._vline = curses.ACS_VLINE & _NOT_A_COLOR
+        cls._hline = curses.ACS_HLINE & _NOT_A_COLOR
+
     # -------------------------------------------------------------------------------
 
     def _get_border_symbol(self, y: int, x: int) -> tuple[int, int]:
@@ -228,6 +242,10 @@ class Grid:
         self.boxes = [self.win]
         self.boxnames = {self.win: "grid"}
         self._builder: GridBuilder
+        # (nlines, ncols, begin_y, begin_x) of each box when `grid` was last built.
+        self._layout: list[tuple[int, int, int, int]] | None = None
+        # incremented whenever a box is added or the boxes are discarded.
+        self.generation = 0
 
         libcurses.core.register_fkey(
             lambda key: self.handle_term_resized_event(), curses.KEY_RESIZE
@@ -254,6 +272,33 @@ class Grid:
             + ")"
         )
 
+    def reset(self, bkgd_grid: CharAttr = None, bkgd_box: CharAttr = None) -> None:
+        """Discard all boxes, and reconfigure the grid, on the same window.
+
+        Args:
+            bkgd_grid: tuple(ch[,attr]) to apply to grid.
+            bkgd_box: tuple(ch[,attr]) to apply to boxes.
+
+        The windows of discarded boxes are kept, and reused when a box
+        of the same name is added again; they are erased, and their
+        backgrounds are set to `bkgd_box`, or cleared.
+        """
+
+        if bkgd_grid is not None:
+            self.win.bkgd(*bkgd_grid)
+        self.bkgd_box = bkgd_box
+        for win in self.boxes[1:]:
+            win.bkgd(*(bkgd_box or (ord(" "), curses.A_NORMAL)))
+            win.erase()
+
+        self.grid = [[0 for x in range(self.ncols)] for y in range(self.nlines)]
+        self.attrs = [[0 for x in range(self.ncols)] for y in range(self.nlines)]
+        self._draw_box(self.nlines, self.ncols, 0, 0)
+        self.boxes = self.boxes[:1]
+        self._layout = None
+        self.generation += 1
+        logger.trace(self)
+
     def register_builder(self, func: GridBuilder) -> None:
         """Register `func` to add boxes to this grid.
 
@@ -457,6 +502,7 @@ class Grid:
             self.boxes.append(win)
             self.boxnames[win] = boxname
 
+        self.generation += 1
         logger.trace(f"winyx={self.winyx(win)}")
         return win
 
@@ -595,38 +641,59 @@ class Grid:
 
     def _render_boxes(self) -> None:
 
+        # collect failures and report them once, not once per cell.
+        errors: list[tuple[int, int, str]] = []
+
         for y in range(self.nlines):
-            for x in range(self.ncols):
-                if self.grid[y][x]:
+            row = self.grid[y]
+            # draw each run of identical border characters with one `hline`;
+            # unlike `addch`, `hline` does not fail in the lower-right corner.
+            run_x, run_ch, run_len = 0, 0, 0
+
+            for x in range(self.ncols + 1):  # +1 to flush the last run.
+                if x < self.ncols and row[x]:
                     symbol, attr = self._get_border_symbol(y, x)
+                    char = symbol | attr
+                else:
+                    char = 0
 
-                    try:
-                        self.win.addch(y, x, symbol, attr)
-                        # logger.trace(f'self={self} y={y} x={x}')
+                if char and char == run_ch:
+                    run_len += 1
+                    continue
 
+                if run_ch:
+                    try:
+                        self.win.hline(y, run_x, run_ch, run_len)
                     except curses.error as err:
-                        # expect an error in the lower-right corner.
-                        if y != self.nlines - 1 or x != self.ncols - 1:
-                            _d1 = y - (self.nlines - 1)
-                            _d2 = x - (self.ncols - 1)
-                            logger.error(
-                                f"y={y} x={x} _d1={_d1} _d2={_d2} err={err} self={self}"
-                            )
-                            # raise
-
-    def redraw(self) -> None:
-        """Redraw grid."""
+                        errors.append((y, run_x, str(err)))
+
+                run_x, run_ch, run_len = x, char, 1
+
+        if errors:
+            logger.error(f"{len(errors)} failures, first={errors[0]} self={self}")
+
+    def redraw(self, update: bool = True) -> None:
+        """Redraw grid.
+
+        Args:
+            update: call `curses.doupdate`; pass False to leave the boxes
+                noutrefresh'ed for the caller's next `doupdate` (e.g., `getkey`).
+        """
 
         with libcurses.core.LOCK:
             self.win.clear()
-            self.grid = [[0 for x in range(self.ncols)] for y in range(self.nlines)]
 
-            self._draw_box(self.nlines, self.ncols, 0, 0)
+            # rebuild the grid only if a box has been added, moved or resized
+            # since the last redraw.
+            layout = [(*win.getmaxyx(), *win.getbegyx()) for win in self.boxes[1:]]
+            if layout != self._layout:
+                self._layout = layout
+                self.grid = [[0 for x in range(self.ncols)] for y in range(self.nlines)]
 
-            for win in self.boxes[1:]:
-                nlines, ncols = win.getmaxyx()
-                begin_y, begin_x = win.getbegyx()
-                self._draw_box(nlines + 2, ncols + 2, begin_y - 1, begin_x - 1)
+                self._draw_box(self.nlines, self.ncols, 0, 0)
+
+                for nlines, ncols, begin_y, begin_x in layout:
+                    self._draw_box(nlines + 2, ncols + 2, begin_y - 1, begin_x - 1)
 
             self._render_boxes()
 
@@ -634,7 +701,8 @@ class Grid:
                 win.touchwin()
                 win.noutrefresh()
 
-            curses.doupdate()
+            if update:
+                curses.doupdate()
 
     def refresh(self) -> None:
         """Noutrefresh grid."""
@@ -693,6 +761,8 @@ class Grid:
         self.grid = [[0 for x in range(self.ncols)] for y in range(self.nlines)]
         self.attrs = [[0 for x in range(self.ncols)] for y in range(self.nlines)]
         self.boxes = self.boxes[:1]
+        self._layout = None
+        self.generation += 1
         if self._builder is not None:
             self._builder()
         # self.redraw()
@@ -709,25 +779,25 @@ class Grid:
         if not (mouse.button == 1 and (mouse.is_pressed or mouse.nclicks == 2)):
             return False  # we don't care, try another handler
 
+        # inline `_mouse_min/max_y/x`; this runs for every mouse event.
+        begin_y, begin_x = self.begin_y, self.begin_x
         if not (
-            mouse.x >= self._mouse_min_x
-            and mouse.x <= self._mouse_max_x
-            and mouse.y >= self._mouse_min_y
-            and mouse.y <= self._mouse_max_y
+            begin_y < mouse.y < begin_y + self.nlines - 1
+            and begin_x < mouse.x < begin_x + self.ncols - 1
         ):
             # logger.trace('not within grid')
             return False
 
-        char = self.win.inch(mouse.y, mouse.x) & ~curses.A_COLOR
+        char = self.win.inch(mouse.y, mouse.x) & _NOT_A_COLOR
 
-        if char == curses.ACS_VLINE:
+        if char == self._vline:
             left = self.getwin(mouse.y, mouse.x - 1)
             right = self.getwin(mouse.y, mouse.x + 1)
             self._resize(mouse, left=left, right=right)
             # logger.trace('after _resize left/right')
             return True
 
-        if char == curses.ACS_HLINE:
+        if char == self._hline:
             upper = self.getwin(mouse.y - 1, mouse.x)
             lower = self.getwin(mouse.y + 1, mouse.x)
             self._resize(mouse, upper=upper, lower=lower)
@@ -796,7 +866,7 @@ class Grid:
             if not key:
                 return
 
-            if key in (curses.ascii.LF, curses.ascii.CR, curses.ascii.ESC, curses.KEY_ENTER):
+            if key in _RESIZE_EXIT_KEYS:
                 return
 
             if key == curses.ascii.FF:
@@ -23,10 +23,19 @@ class LogSink:
 
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, logwin: curses.window) -> None:
-        """Begin logging to `logwin`."""
+    def __init__(self, logwin: curses.window, enqueue: bool = False) -> None:
+        """Begin logging to `logwin`.
+
+        Args:
+            logwin: curses window to write log messages to.
+            enqueue: write to `logwin` from loguru's worker thread, rather
+                than from the thread that logs the message.
+
+        Call `close` before leaving `libcurses.wrapper`.
+        """
 
         self.logwin = logwin
+        self.enqueue = enqueue
         self.level = "INFO"
         self.location = "{name}.{function}:{line}"
         self.delim = "|"
@@ -42,6 +51,19 @@ class LogSink:
         self._colormap = get_colormap()
         self._config()
 
+    def close(self) -> None:
+        """Stop logging to `logwin`.
+
+        Call before leaving `libcurses.wrapper`. With `enqueue`, this
+        waits for queued messages to be written; messages left in the
+        queue would otherwise be written after `curses.endwin`, and
+        return the terminal to curses mode.
+        """
+
+        if self._id is not None:
+            logger.remove(self._id)
+            self._id = None
+
     def reset_padding(self) -> None:
         """Reset column padding."""
 
@@ -85,6 +107,7 @@ class LogSink:
         self._id = logger.add(
             self._sink,
             level=self.level,
+            enqueue=self.enqueue,
             format=self.delim.join(
                 [
                     "{time:HH:mm:ss.SSS}",
@@ -102,30 +125,27 @@ class LogSink:
 
         delim = self.delim
         time, location, level, message = msg.split(delim, maxsplit=3)
-        color = self._colormap[level]
+        if (color := self._colormap.get(level)) is None:
+            # a level created after `get_colormap`; don't touch the window.
+            return
+
+        self._padloc = max(self._padloc, len(location))
+        location = location.ljust(self._padloc)
 
-        _len = len(location)
-        self._padloc = max(self._padloc, _len)
-        location += " " * (self._padloc - _len)
+        self._padlev = max(self._padlev, len(level))
+        level = level.ljust(self._padlev)
 
-        _len = len(level)
-        self._padlev = max(self._padlev, _len)
-        level += " " * (self._padlev - _len)
+        if location:
+            line = delim.join([time, location, level, message.rstrip()])
+        else:
+            line = delim.join([time, level, message.rstrip()])
 
         win = self.logwin
 
         with libcurses.core.preserve_cursor():
 
             if sum(win.getyx()):
-                win.addch("\n")
-            win.addstr(time, color)
-            win.addch(delim)
-
-            if location:
-                win.addstr(location, color)
-                win.addch(delim)
-
-            win.addstr(level, color)
-            win.addch(delim)
-            win.addstr(message.rstrip(), color)
-            win.refresh()
+                line = "\n" + line
+            win.addstr(line, color)
+            # `preserve_cursor` updates the screen on the way out.
+            win.noutrefresh()
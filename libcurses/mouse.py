@@ -18,6 +18,9 @@ __all__ = ["Mouse", "MouseEvent"]
 
 MouseHandler = Callable[[MouseEvent, Any], bool]
 
+# the events `Mouse.enable` asks `curses.getch` to report.
+_MOUSEMASK = curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION
+
 
 class Mouse:
     """The `Mouse` class provides methods to...
@@ -37,10 +40,9 @@ class Mouse:
         Call after `curses.initscr`. If trouble, try `TERM=xterm-1002`.
         """
 
-        newmask = curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION
-        (availmask, oldmask) = curses.mousemask(newmask)
+        (availmask, oldmask) = curses.mousemask(_MOUSEMASK)
         logger.trace(
-            f"(availmask={availmask:#x}, oldmask={oldmask:#x}) = mousemask({newmask:#x})"
+            f"(availmask={availmask:#x}, oldmask={oldmask:#x}) = mousemask({_MOUSEMASK:#x})"
         )
 
     # -------------------------------------------------------------------------------
@@ -85,7 +87,7 @@ class Mouse:
     def clear_mouse_handlers(cls) -> None:
         """Remove all mouse handlers."""
 
-        cls._yxhandlers_by_row = defaultdict(list)
+        cls._yxhandlers_by_row.clear()
 
     @classmethod
     def handle_mouse_event(cls) -> bool:
@@ -8,6 +8,51 @@ import curses
 
 __all__ = ["MouseEvent"]
 
+# `bstate` masks tested by `MouseEvent`, combined once at import.
+
+_BUTTON1 = (
+    curses.BUTTON1_CLICKED
+    | curses.BUTTON1_DOUBLE_CLICKED
+    | curses.BUTTON1_TRIPLE_CLICKED
+    | curses.BUTTON1_PRESSED
+    | curses.BUTTON1_RELEASED
+)
+_BUTTON2 = (
+    curses.BUTTON2_CLICKED
+    | curses.BUTTON2_DOUBLE_CLICKED
+    | curses.BUTTON2_TRIPLE_CLICKED
+    | curses.BUTTON2_PRESSED
+    | curses.BUTTON2_RELEASED
+)
+_BUTTON3 = (
+    curses.BUTTON3_CLICKED
+    | curses.BUTTON3_DOUBLE_CLICKED
+    | curses.BUTTON3_TRIPLE_CLICKED
+    | curses.BUTTON3_PRESSED
+    | curses.BUTTON3_RELEASED
+)
+_BUTTON4 = (
+    curses.BUTTON4_CLICKED
+    | curses.BUTTON4_DOUBLE_CLICKED
+    | curses.BUTTON4_TRIPLE_CLICKED
+    | curses.BUTTON4_PRESSED
+    | curses.BUTTON4_RELEASED
+)
+_PRESSED = (
+    curses.BUTTON1_PRESSED
+    | curses.BUTTON2_PRESSED
+    | curses.BUTTON3_PRESSED
+    | curses.REPORT_MOUSE_POSITION
+)
+_RELEASED = curses.BUTTON1_RELEASED | curses.BUTTON2_RELEASED | curses.BUTTON3_RELEASED
+_CLICKED = curses.BUTTON1_CLICKED | curses.BUTTON2_CLICKED | curses.BUTTON3_CLICKED
+_DOUBLE_CLICKED = (
+    curses.BUTTON1_DOUBLE_CLICKED | curses.BUTTON2_DOUBLE_CLICKED | curses.BUTTON3_DOUBLE_CLICKED
+)
+_TRIPLE_CLICKED = (
+    curses.BUTTON1_TRIPLE_CLICKED | curses.BUTTON2_TRIPLE_CLICKED | curses.BUTTON3_TRIPLE_CLICKED
+)
+
 
 class MouseEvent:
     """Wrap `curses.getmouse` with additional, convenience-properties.
@@ -54,42 +99,14 @@ class MouseEvent:
             return
 
         #
-        if bstate & (
-            curses.BUTTON1_CLICKED
-            | curses.BUTTON1_DOUBLE_CLICKED
-            | curses.BUTTON1_TRIPLE_CLICKED
-            | curses.BUTTON1_PRESSED
-            | curses.BUTTON1_RELEASED
-        ):
+        if bstate & _BUTTON1:
             self.button = 1  # left
-
-        elif bstate & (
-            curses.BUTTON2_CLICKED
-            | curses.BUTTON2_DOUBLE_CLICKED
-            | curses.BUTTON2_TRIPLE_CLICKED
-            | curses.BUTTON2_PRESSED
-            | curses.BUTTON2_RELEASED
-        ):
+        elif bstate & _BUTTON2:
             self.button = 2  # middle
-
-        elif bstate & (
-            curses.BUTTON3_CLICKED
-            | curses.BUTTON3_DOUBLE_CLICKED
-            | curses.BUTTON3_TRIPLE_CLICKED
-            | curses.BUTTON3_PRESSED
-            | curses.BUTTON3_RELEASED
-        ):
+        elif bstate & _BUTTON3:
             self.button = 3  # right
-
-        elif bstate & (
-            curses.BUTTON4_CLICKED
-            | curses.BUTTON4_DOUBLE_CLICKED
-            | curses.BUTTON4_TRIPLE_CLICKED
-            | curses.BUTTON4_PRESSED
-            | curses.BUTTON4_RELEASED
-        ):
+        elif bstate & _BUTTON4:
             self.button = 4  # wheelup / forward
-
         else:
             self.button = 5  # wheeldown / backward
 
@@ -98,34 +115,15 @@ class MouseEvent:
         self.is_pressed = False
         self.is_released = False
 
-        if bstate & (
-            curses.BUTTON1_PRESSED
-            | curses.BUTTON2_PRESSED
-            | curses.BUTTON3_PRESSED
-            | curses.REPORT_MOUSE_POSITION
-        ):
+        if bstate & _PRESSED:
             self.is_pressed = True
-
-        elif bstate & (
-            curses.BUTTON1_RELEASED | curses.BUTTON2_RELEASED | curses.BUTTON3_RELEASED
-        ):
+        elif bstate & _RELEASED:
             self.is_released = True
-
-        elif bstate & (curses.BUTTON1_CLICKED | curses.BUTTON2_CLICKED | curses.BUTTON3_CLICKED):
+        elif bstate & _CLICKED:
             self.nclicks = 1
-
-        elif bstate & (
-            curses.BUTTON1_DOUBLE_CLICKED
-            | curses.BUTTON2_DOUBLE_CLICKED
-            | curses.BUTTON3_DOUBLE_CLICKED
-        ):
+        elif bstate & _DOUBLE_CLICKED:
             self.nclicks = 2
-
-        elif bstate & (
-            curses.BUTTON1_TRIPLE_CLICKED
-            | curses.BUTTON2_TRIPLE_CLICKED
-            | curses.BUTTON3_TRIPLE_CLICKED
-        ):
+        elif bstate & _TRIPLE_CLICKED:
             self.nclicks = 3
 
         #
@@ -5,7 +5,6 @@ import sys
 import threading
 import time
 from collections import deque
-from itertools import cycle
 
 from loguru import logger
 
@@ -42,21 +41,27 @@ class SampleTimer(threading.Thread):
         register_fkey(lambda key: self.intervals.rotate(-1), curses.KEY_F6)
         register_fkey(lambda key: self.intervals.rotate(1), curses.KEY_F7)
 
+        error, warning, info = logger.error, logger.warning, logger.info
+        debug, trace, log = logger.debug, logger.trace, logger.log
+
+        deadline = time.monotonic()
         while True:
             secs = self.intervals[0]
-            time.sleep(secs)
+            # sleep to a deadline, so time spent logging doesn't stretch the period.
+            deadline = max(deadline + secs, time.monotonic())
+            time.sleep(max(0.0, deadline - time.monotonic()))
             now = time.asctime()
-            logger.error("error every {} seconds at {}", secs, now)
-            logger.warning("warning every {} seconds at {}", secs, now)
-            logger.info("info every {} seconds at {}", secs, now)
-            logger.debug("debug every {} seconds at {}", secs, now)
-            logger.trace("trace every {} seconds at {}", secs, now)
-            logger.log("custom-error", "custom every {} seconds at {}", secs, now)
-            logger.log("custom-warning", "custom every {} seconds at {}", secs, now)
-            logger.log("custom-always", "custom every {} seconds at {}", secs, now)
-            logger.log("custom-info", "custom every {} seconds at {}", secs, now)
-            logger.log("custom-debug", "custom every {} seconds at {}", secs, now)
-            logger.log("custom-trace", "custom every {} seconds at {}", secs, now)
+            error("error every {} seconds at {}", secs, now)
+            warning("warning every {} seconds at {}", secs, now)
+            info("info every {} seconds at {}", secs, now)
+            debug("debug every {} seconds at {}", secs, now)
+            trace("trace every {} seconds at {}", secs, now)
+            log("custom-error", "custom every {} seconds at {}", secs, now)
+            log("custom-warning", "custom every {} seconds at {}", secs, now)
+            log("custom-always", "custom every {} seconds at {}", secs, now)
+            log("custom-info", "custom every {} seconds at {}", secs, now)
+            log("custom-debug", "custom every {} seconds at {}", secs, now)
+            log("custom-trace", "custom every {} seconds at {}", secs, now)
 
     @property
     def interval(self) -> float:
@@ -141,7 +146,7 @@ class Application:
         self.sink = LogSink(self.logwin)
 
         # Change format of `location` field on the fly; (not required)
-        self.location = cycle(
+        self.locations = deque(
             [
                 "{thread.name}.{name}.{function}:{line}",
                 "{name}.{function}:{line}",
@@ -150,15 +155,12 @@ class Application:
                 None,
             ]
         )
-        self.sink.set_location(next(self.location))
-        register_fkey(
-            lambda key: self.sink.set_location(next(self.location)),
-            curses.KEY_F8,
-        )
+        self.sink.set_location(self.locations[0])
+        register_fkey(self._cycle_location, curses.KEY_F8)
 
         # Change verbosity on the fly; (not required)
-        self.verbose = cycle([2, 1, 0])  # ["-vv", "-v", ""]
-        self.sink.set_verbose(next(self.verbose))
+        self.verbosities = deque([2, 1, 0])  # ["-vv", "-v", ""]
+        self.sink.set_verbose(self.verbosities[0])
         register_fkey(self._cycle_verbose, curses.KEY_F9)
 
         # Reset logger column padding.
@@ -166,9 +168,14 @@ class Application:
 
         self.grid.redraw()
 
+    def _cycle_location(self, _key: int) -> None:
+        self.locations.rotate(-1)
+        self.sink.set_location(self.locations[0])
+
     def _cycle_verbose(self, _key: int) -> None:
         """This worked as a lambda; mypy didn't like it as a lambda."""
-        self.sink.set_verbose(next(self.verbose))
+        self.verbosities.rotate(-1)
+        self.sink.set_verbose(self.verbosities[0])
         self._add_history("from global fkey: " + self.sink.level)
 
     def run(self) -> None:
@@ -180,17 +187,21 @@ class Application:
 
         self.mode = "menu"
 
-        while self.mode:
-            if self.mode == "menu":
-                self.menu_mode()
-            elif self.mode == "line":
-                self.getline_mode()
-            elif self.mode == "key":
-                self.getkey_mode()
-            else:
-                raise RuntimeError(self.mode)
-
-            self.grid.refresh()
+        try:
+            while self.mode:
+                if self.mode == "menu":
+                    self.menu_mode()
+                elif self.mode == "line":
+                    self.getline_mode()
+                elif self.mode == "key":
+                    self.getkey_mode()
+                else:
+                    raise RuntimeError(self.mode)
+
+                self.grid.refresh()
+        finally:
+            # stop logging to `logwin` before `wrapper` ends curses.
+            self.sink.close()
 
     # def premenu(self) -> None:
     #     """Top of `getkey`-loop on clear window at (0, 0) before rendering menu."""
@@ -1,368 +1,79 @@
-import contextlib
 import curses
+import threading
+from collections import defaultdict
+from typing import Callable, cast
 
-from loguru import logger
+import pytest
 
-import libcurses
+import libcurses.core
 from libcurses.grid import Grid
-
-
-def test_stub() -> None:
-    pass
-
-
-# -------------------------------------------------------------------------------
-
-
-def main1(win: curses.window) -> None:
-
-    win.clear()
-    win.refresh()
-    nlines, ncols = win.getmaxyx()
-    grid = Grid(win)
-    grid.box("1", 5, 5, begin_y=3, begin_x=3)
-    grid.box("2", 3, 3, begin_y=0, begin_x=ncols - 3)
-    grid.box("3", 3, 3, begin_y=nlines - 4, begin_x=ncols - 4)  # problem
-    grid.box("4", 3, 3, begin_y=nlines - 5, begin_x=2)
-
-    #
-    grid.box("5", 5, 10, begin_y=2, begin_x=20)
-    grid.box("6", 5, 10, begin_y=4, begin_x=20)
-
-    grid.box("7", 5, 10, begin_y=2, begin_x=40)
-    grid.box("8", 5, 10, begin_y=5, begin_x=40)  # problem
-
-    grid.box("9", 5, 10, begin_y=2, begin_x=60)
-    grid.box("10", 5, 10, begin_y=6, begin_x=60)
-
-    grid.box("11", 5, 10, begin_y=2, begin_x=80)
-    grid.box("12", 5, 10, begin_y=7, begin_x=80)  # problem
-
-    grid.box("13", 5, 10, begin_y=2, begin_x=100)
-    grid.box("14", 5, 10, begin_y=8, begin_x=100)
-
-    #
-    grid.box("15", 3, 5, begin_y=20, begin_x=4)
-    grid.box("16", 3, 5, begin_y=20, begin_x=8)
-    grid.box("17", 3, 5, begin_y=20, begin_x=12)
-
-    grid.box("18", 3, 5, begin_y=20, begin_x=20)
-    grid.box("19", 3, 5, begin_y=20, begin_x=23)
-    grid.box("20", 3, 5, begin_y=20, begin_x=26)  # problem
-
-    grid.box("21", 3, 5, begin_y=20, begin_x=36)
-    grid.box("22", 3, 5, begin_y=20, begin_x=40)
-    grid.box("23", 3, 5, begin_y=20, begin_x=44)
-
-    grid.box("24", 3, 5, begin_y=20, begin_x=52)
-    grid.box("25", 3, 5, begin_y=20, begin_x=57)
-    grid.box("26", 3, 5, begin_y=20, begin_x=62)  # problem
-
-    grid.box("27", 3, 5, begin_y=20, begin_x=68)
-    grid.box("28", 3, 5, begin_y=20, begin_x=72)
-    grid.box("29", 3, 5, begin_y=20, begin_x=76)
-
-    prompt(grid, win)
-    curses.endwin()
-
-
-# -------------------------------------------------------------------------------
-
-
-def main3(win: curses.window) -> None:
-
-    #    0----+----1----+----2----+----3
-    #  0 +--------+--------+--------+
-    #  1 |        |        |        |
-    #  2 |12345678|12345678|12345678|
-    #  3 |        |        |        |
-    #  4 +--------+--------+--------+
-    #  5 |        |        |        |
-    #  6 |12345678|12345678|12345678|
-    #  7 |        |        |        |
-    #  8 +--------+--------+--------+
-    #  9 |        |        |        |
-    # 10 |12345678|12345678|12345678|
-    # 11 |        |        |        |
-    # 12 +--------+--------+--------+
-
-    win.clear()
-    win.refresh()
-    grid = Grid(win)
-
-    grid.box("a", 5, 10, begin_y=0, begin_x=0)
-    grid.box("b", 5, 10, begin_y=0, begin_x=9)
-    grid.box("c", 5, 10, begin_y=0, begin_x=18)
-
-    grid.box("d", 5, 10, begin_y=4, begin_x=0)
-    grid.box("e", 5, 10, begin_y=4, begin_x=9)
-    grid.box("f", 5, 10, begin_y=4, begin_x=18)
-
-    grid.box("g", 5, 10, begin_y=8, begin_x=0)
-    grid.box("h", 5, 10, begin_y=8, begin_x=9)
-    grid.box("i", 5, 10, begin_y=8, begin_x=18)
-
-    for idx, w in enumerate(grid.boxes):
-        w.addstr(str(idx))
-
-    prompt(grid, win)
-    curses.endwin()
-
-
-# -------------------------------------------------------------------------------
-
-
-@logger.catch
-def main4(win: curses.window) -> None:
-
-    _, c2, c3 = setup_test(win)
-
-    _test_backgrounds(win, c2, c3, msg="win")
-
-    nlines, ncols = win.getmaxyx()
-    for i in range(0, 10, 2):
-        logger.success(f"iteration {i}")
-        begin_y = i
-        begin_x = i
-        win = curses.newwin(nlines - (2 * begin_y), ncols - (2 * begin_x), begin_y, begin_x)
-        _test_backgrounds(win, c2, c3, msg=f"i={i}")
-        grid = Grid(win)
-        _test_outside_ltor_ttob(grid)
-        _test_outside_rtol_btot(grid)
-        _test_outside_plus(grid)
-        prompt(grid, win, msg=f"i={i} bkgd default {grid}")
-
-    curses.endwin()
-
-
-# -------------------------------------------------------------------------------
-
-
-@logger.catch
-def main5(win: curses.window) -> None:
-
-    # pylint: disable=too-many-locals
-
-    c1, c2, c3 = setup_test(win)
-
-    grid = Grid(win, bkgd_grid=(ord("+"), c2), bkgd_box=(ord("."), c3))
-    # grid = Grid(win, bkgd_grid=('.', c2))
-    # grid = Grid(win, bkgd_grid=('.', c3))
-    # grid = Grid(win, bkgd_box=('.', c2))
-    # grid = Grid(win, bkgd_box=('.', c3))
-    # grid = Grid(win)
-
-    # check screen size!! 36x146
-
-    _test_crossing_x = False
-    if _test_crossing_x:
-        for i in range(0, 18, 2):
-            grid.box(
-                f"{i}:ul", nlines=4, ncols=5, begin_y=2 * i, begin_x=3 * i, left=grid, top=grid
-            )
-            grid.box(
-                f"{i}:ur", nlines=4, ncols=5, begin_y=2 * i, begin_x=-3 * i, right=grid, top=grid
-            )
-            grid.box(
-                f"{i}:lr",
-                nlines=4,
-                ncols=5,
-                begin_y=-2 * i,
-                begin_x=-3 * i,
-                right=grid,
-                bottom=grid,
-            )
-            grid.box(
-                f"{i}:ll",
-                nlines=4,
-                ncols=5,
-                begin_y=-2 * i,
-                begin_x=3 * i,
-                left=grid,
-                bottom=grid,
-            )
-            prompt(grid, win)
-        curses.endwin()
-        return
-
-    _test_corners = True
-    if _test_corners:
-        # corners
-        ul = grid.box("ul", 5, 20, top=grid, left=grid)
-        ur = grid.box("ur", 5, 20, top=grid, right=grid)
-        lr = grid.box("lr", 5, 20, right=grid, bottom=grid)
-        ll = grid.box("ll", 5, 20, bottom=grid, left=grid)
-        prompt(grid, win)
-
-    _test_fillers_none_to_grid = True
-    if _test_fillers_none_to_grid:
-        # fillers, none to grid
-        # pylint: disable=possibly-used-before-assignment
-        tf = grid.box("tf", 5, 0, top=grid, right2l=ur, bottom=None, left2r=ul)
-        rf = grid.box("rf", 0, 20, top2b=ur, right=grid, bottom2t=lr, left2r=None)
-        bf = grid.box("bf", 5, 0, top2b=None, right2l=lr, bottom=grid, left2r=ll)
-        lf = grid.box("lf", 0, 20, top2b=ul, right2l=None, bottom2t=ll, left=grid)
-        prompt(grid, win)
-
-    # pylint: disable=using-constant-test
-    if False:
-        # fillers to grid
-        grid.box("full", 0, 0, left=grid, right=grid, top=grid, bottom=grid)
-        grid.box("box", 5, 20, begin_y=10, begin_x=10, bkgd_box=("@", c1))
-        # prompt(grid, win)
-
-    if True:
-        for i in range(0, 14, 2):
-            grid.box(
-                f"{i}:ul", nlines=4, ncols=5, begin_y=2 * i, begin_x=3 * i, left2r=lf, top2b=tf
-            )
-            grid.box(
-                f"{i}:ur", nlines=4, ncols=5, begin_y=2 * i, begin_x=-3 * i, right2l=rf, top2b=tf
-            )
-            grid.box(
-                f"{i}:lr",
-                nlines=4,
-                ncols=5,
-                begin_y=-2 * i,
-                begin_x=-3 * i,
-                right2l=rf,
-                bottom2t=bf,
-            )
-            grid.box(
-                f"{i}:ll",
-                nlines=4,
-                ncols=5,
-                begin_y=-2 * i,
-                begin_x=3 * i,
-                left2r=lf,
-                bottom2t=bf,
-            )
-        prompt(grid, win, "check screen size!! 36x146")
-        curses.endwin()
-        return
-
-    if True:
-        _test_outside_ltor_ttob(grid)
-        _test_outside_rtol_btot(grid)
-        _test_outside_plus(grid)
-        prompt(grid, win, "check screen size!! 36x146")
-        # _test_backgrounds(win, c2, c3, 'hello')
-        curses.endwin()
-        return
-
-    # center
-    # cntr = grid.box('cntr', 0, 0, top2b=tf, right2l=rf, bottom2t=bf, left2r=lf)
-    # _ = cntr
-
-    # split the center vertically
-    # vs = grid.box('vs', 0, int(cntr.getmaxyx()[1] / 2),
-    #               top=cntr, right=None, bottom=cntr, left=cntr)
-    # vs = grid.box('vs', 0, 7, top=cntr, right=None, bottom=cntr, left=cntr)
-
-    #
-    prompt(grid, win)
-    curses.endwin()
-
-
-# -------------------------------------------------------------------------------
-
-
-@logger.catch
-def main6(win: curses.window) -> None:
-
-    _, c2, c3 = setup_test(win)
-
-    grid = Grid(win, bkgd_grid=(ord("+"), c2), bkgd_box=(ord("."), c3))
-
-    top = grid.box("hsplit-top", 5, 0, left=grid, right=grid, top=grid)
-    grid.box("hsplit-bot", 0, 0, left=grid, right=grid, top2b=top, bottom=grid)
-    prompt(grid, win)
-
-    bot = grid.box("hsplit-bot", 5, 0, left=grid, right=grid, bottom=grid)
-    grid.box("hsplit-top", 0, 0, left=grid, right=grid, bottom2t=bot, top=grid)
-    prompt(grid, win)
-
-    left = grid.box("vsplit-left", 0, 20, left=grid, top=grid, bottom=grid)
-    grid.box("vsplit-right", 0, 0, left2r=left, right=grid, top=grid, bottom=grid)
-    prompt(grid, win)
-
-    right = grid.box("vsplit-right", 0, 20, right=grid, top=grid, bottom=grid)
-    grid.box("vsplit-left", 0, 0, left=grid, right2l=right, top=grid, bottom=grid)
-    prompt(grid, win)
-
-
-# -------------------------------------------------------------------------------
-
-
-def setup_test(win: curses.window) -> tuple[int, int, int]:
-    #                   fg                  bg
-    curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_RED)
-    c1 = curses.color_pair(1)
-    curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-    c2 = curses.color_pair(2)
-    curses.init_pair(3, curses.COLOR_BLUE, curses.COLOR_WHITE)
-    c3 = curses.color_pair(3)
-    win.clear()
-    win.bkgd(ord("*"), c1)
-    # prompt(None, win, msg=f'win setup {winyx(win)}')
-    return c1, c2, c3
-
-
-# -------------------------------------------------------------------------------
-
-
-def _test_backgrounds(win: curses.window, c2: int, c3: int, msg: str) -> None:
-
-    grid = Grid(win)
-    _test_outside_ltor_ttob(grid)
-    _test_outside_rtol_btot(grid)
-    _test_outside_plus(grid)
-    prompt(grid, win, msg=f"{msg} bkgd default {grid}")
-
-    grid = Grid(win, bkgd_box=(ord("."), c3))
-    _test_outside_ltor_ttob(grid)
-    _test_outside_rtol_btot(grid)
-    _test_outside_plus(grid)
-    prompt(grid, win, msg=f"{msg} bkgd_box {grid}")
-
-    grid = Grid(win, bkgd_grid=(ord("."), c2))
-    _test_outside_ltor_ttob(grid)
-    _test_outside_rtol_btot(grid)
-    _test_outside_plus(grid)
-    prompt(grid, win, msg=f"{msg} bkgd_grid {grid}")
-
-    grid = Grid(win, bkgd_grid=(ord("."), c2), bkgd_box=(ord("."), c3))
-    _test_outside_ltor_ttob(grid)
-    _test_outside_rtol_btot(grid)
-    _test_outside_plus(grid)
-    prompt(grid, win, msg=f"{msg} bkgd_box bkgd_grid {grid}")
-
-
-# -------------------------------------------------------------------------------
-#     +---+
-#     | t |
-# +---+---+---+
-# | l | c | r |
-# +---+---+---+
-#     | b |
-#     +---+
-
-
-def _test_outside_plus(grid: Grid, centered: bool = True) -> None:
-
-    if centered:
-        c = grid.box(
-            "c", 3, 5, begin_y=int(grid.nlines / 2 - 3), begin_x=int(grid.ncols / 2 - 3)
-        )
-    else:
-        c = grid.box("c", 3, 5, begin_y=2, begin_x=4)
-        c = grid.box("c", 3, 5, begin_y=3, begin_x=5)
-        c = grid.box("c", 3, 5, begin_y=4, begin_x=6)
-
-    _ = grid.box("t", 3, 5, bottom2t=c, left=c)
-    _ = grid.box("r", 3, 5, top=c, left2r=c)
-    _ = grid.box("b", 3, 5, top2b=c, left=c)
-    _ = grid.box("l", 3, 5, top=c, right2l=c)
+from libcurses.mouse import Mouse
+
+# boxname: (nlines, ncols, begin_y, begin_x) of the window inside the box.
+Expected = dict[str, tuple[int, int, int, int]]
+
+
+class StubWindow:
+    """Enough of `curses.window` to lay out a `Grid` without a terminal."""
+
+    def __init__(self, nlines: int, ncols: int, begin_y: int = 0, begin_x: int = 0) -> None:
+        self.nlines, self.ncols = nlines, ncols
+        self.begin_y, self.begin_x = begin_y, begin_x
+        self.cells: dict[tuple[int, int], int] = {}  # (y, x): ch|attr drawn there.
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.nlines, self.ncols
+
+    def getbegyx(self) -> tuple[int, int]:
+        return self.begin_y, self.begin_x
+
+    def resize(self, nlines: int, ncols: int) -> None:
+        self.nlines, self.ncols = nlines, ncols
+
+    def mvwin(self, new_y: int, new_x: int) -> None:
+        self.begin_y, self.begin_x = new_y, new_x
+
+    def clear(self) -> None:
+        self.cells.clear()
+
+    def erase(self) -> None:
+        self.cells.clear()
+
+    def hline(self, y: int, x: int, ch: int, n: int) -> None:
+        for i in range(n):
+            self.cells[y, x + i] = ch
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        # bkgd, move, ...
+        return lambda *args: None
+
+
+@pytest.fixture(name="grid")
+def fixture_grid(monkeypatch: pytest.MonkeyPatch) -> Grid:
+    # the ACS_* constants are not defined until `curses.initscr`.
+    for idx, name in enumerate(
+        [
+            "ACS_BTEE",
+            "ACS_HLINE",
+            "ACS_LLCORNER",
+            "ACS_LRCORNER",
+            "ACS_LTEE",
+            "ACS_PLUS",
+            "ACS_RTEE",
+            "ACS_TTEE",
+            "ACS_ULCORNER",
+            "ACS_URCORNER",
+            "ACS_VLINE",
+        ]
+    ):
+        monkeypatch.setattr(curses, name, 0x400000 + idx, raising=False)
+    monkeypatch.setattr(curses, "newwin", StubWindow)
+    monkeypatch.setattr(curses, "mousemask", lambda mask: (mask, 0))
+    monkeypatch.setattr(curses, "doupdate", lambda: None)
+    monkeypatch.setattr(libcurses.core, "LOCK", threading.Lock(), raising=False)
+    monkeypatch.setattr(libcurses.core, "FKEYS", defaultdict(list), raising=False)
+    monkeypatch.setattr(Mouse, "_handlers", [])
+    return Grid(cast(curses.window, StubWindow(24, 80)))
 
 
 # -------------------------------------------------------------------------------
@@ -374,10 +85,25 @@ def _test_outside_plus(grid: Grid, centered: bool = True) -> None:
 # | g | h | i |
 # +---+---+---+
 
+ABC_DEF_GHI: Expected = {
+    "a": (3, 8, 1, 1),
+    "b": (3, 8, 1, 10),
+    "c": (3, 8, 1, 19),
+    "d": (3, 8, 5, 1),
+    "e": (3, 8, 5, 10),
+    "f": (3, 8, 5, 19),
+    "g": (3, 8, 9, 1),
+    "h": (3, 8, 9, 10),
+    "i": (3, 8, 9, 19),
+}
+
 
-def _test_outside_ltor_ttob(grid: Grid) -> None:
-    logger.success("left to right, from top to bottom")
+def _build_coordinates(grid: Grid) -> None:
+    for boxname, (nlines, ncols, begin_y, begin_x) in ABC_DEF_GHI.items():
+        grid.box(boxname, nlines + 2, ncols + 2, begin_y=begin_y - 1, begin_x=begin_x - 1)
 
+
+def _build_ltor_ttob(grid: Grid) -> None:
     a = grid.box("a", 5, 10, top=grid, left=grid)
     b = grid.box("b", 5, 10, top=a, left2r=a)
     _ = grid.box("c", 5, 10, top=a, left2r=b)
@@ -401,9 +127,7 @@ def _test_outside_ltor_ttob(grid: Grid) -> None:
 # +---+---+---+
 
 
-def _test_outside_rtol_btot(grid: Grid) -> None:
-    logger.success("right to left, from bottom to top")
-
+def _build_rtol_btot(grid: Grid) -> None:
     a = grid.box("a", 5, 10, bottom=grid, right=grid)
     b = grid.box("b", 5, 10, top=a, right2l=a)
     _ = grid.box("c", 5, 10, top=a, right2l=b)
@@ -417,54 +141,164 @@ def _test_outside_rtol_btot(grid: Grid) -> None:
     _ = grid.box("i", 5, 10, bottom2t=d, right2l=h)
 
 
-# -------------------------------------------------------------------------------
-
-#
-# j = grid.box('j', 5, -10, right2l=win)
-# k = grid.box('k', 5, 10, right2l=j)
-# l = grid.box('l', 5, 10, right2l=k)
-
-#
-# m = grid.box('m', -5, -10, bottom2t=win, right2l=win)
-# n = grid.box('n', -5, 10, bottom2t=win, right2l=m)
-# o = grid.box('o', -5, 10, bottom2t=win, right2l=n)
-
-#
-# p = grid.box('p', -5, 10, bottom2t=win)
-# q = grid.box('q', -5, 10, bottom2t=win, left2r=p)
-# r = grid.box('r', -5, 10, bottom2t=win, left2r=q)
+IHG_FED_CBA: Expected = {
+    "a": (3, 8, 20, 71),
+    "b": (3, 8, 20, 62),
+    "c": (3, 8, 20, 53),
+    "d": (3, 8, 16, 71),
+    "e": (3, 8, 16, 62),
+    "f": (3, 8, 16, 53),
+    "g": (3, 8, 12, 71),
+    "h": (3, 8, 12, 62),
+    "i": (3, 8, 12, 53),
+}
 
 # -------------------------------------------------------------------------------
 
 
-def prompt(grid: Grid, win: curses.window, msg: str = "Press any key to continue") -> None:
+def _build_hsplit(grid: Grid) -> None:
+    top = grid.box("top", 5, 0, left=grid, right=grid, top=grid)
+    grid.box("bot", 0, 0, left=grid, right=grid, top2b=top, bottom=grid)
 
-    # win.erase()
 
-    if grid:
-        for idx, w in enumerate(grid.boxes):
-            with contextlib.suppress(curses.error):
-                w.addstr(0, 0, str(idx))
+def _build_vsplit(grid: Grid) -> None:
+    left = grid.box("left", 0, 20, left=grid, top=grid, bottom=grid)
+    grid.box("right", 0, 0, left2r=left, right=grid, top=grid, bottom=grid)
 
-        grid.redraw()
 
-    win = grid.win
-    nlines = win.getmaxyx()[0]
-    win.addstr(nlines - 6, 20, msg)
-    while libcurses.getkey(win) == curses.KEY_RESIZE:
-        logger.success("resized!")
+@pytest.mark.parametrize(
+    ("build", "expected"),
+    [
+        (_build_coordinates, ABC_DEF_GHI),
+        (_build_ltor_ttob, ABC_DEF_GHI),
+        (_build_rtol_btot, IHG_FED_CBA),
+        (_build_hsplit, {"top": (3, 78, 1, 1), "bot": (18, 78, 5, 1)}),
+        (_build_vsplit, {"left": (22, 18, 1, 1), "right": (22, 59, 1, 20)}),
+    ],
+    ids=["coordinates", "ltor_ttob", "rtol_btot", "hsplit", "vsplit"],
+)
+def test_grid_scenarios(grid: Grid, build: Callable[[Grid], None], expected: Expected) -> None:
+    build(grid)
+    actual = {grid.boxnames[w]: (*w.getmaxyx(), *w.getbegyx()) for w in grid.boxes[1:]}
+    assert actual == expected
 
 
-# -------------------------------------------------------------------------------
+def test_box_rejects_mutually_exclusive_references(grid: Grid) -> None:
+    a = grid.box("a", 5, 10, top=grid, left=grid)
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        grid.box("b", 5, 10, top=a, top2b=a, left=grid)
 
-if __name__ == "__main__":
-    # logger.remove(0)
-    # import sys
-    # logger.add(sys.stderr,
-    #            format="{level} {function} {line} {message}",
-    #            colorize=True, level='TRACE')
-    # curses.wrapper(main1)
-    # curses.wrapper(main3)
-    # curses.wrapper(main4)
-    libcurses.wrapper(main5)
-    # curses.wrapper(main6)
+
+def test_reset_reuses_windows_by_name(grid: Grid) -> None:
+    _build_ltor_ttob(grid)
+    windows = grid.boxes[1:]
+    generation = grid.generation
+    for w in windows:
+        cast(StubWindow, w).hline(0, 0, ord("x"), 1)
+
+    grid.reset(bkgd_box=(ord("."), 0))
+    assert grid.boxes == [grid.win]
+    assert not any(cast(StubWindow, w).cells for w in windows)
+    assert grid.generation > generation
+    assert grid.bkgd_box == (ord("."), 0)
+
+    _build_rtol_btot(grid)
+    assert sorted(map(id, grid.boxes[1:])) == sorted(map(id, windows))
+    actual = {grid.boxnames[w]: (*w.getmaxyx(), *w.getbegyx()) for w in grid.boxes[1:]}
+    assert actual == IHG_FED_CBA
+
+
+def test_redraw_renders_border_cells(grid: Grid) -> None:
+    _build_ltor_ttob(grid)
+    a = grid.boxes[1]
+    grid.border_attr(a, Grid.N.R, True)
+    grid.redraw()
+
+    # each border cell, as drawn one `addch` at a time.
+    expected = {}
+    for y, row in enumerate(grid.grid):
+        for x, cell in enumerate(row):
+            if cell:
+                symbol, attr = grid._get_border_symbol(y, x)  # noqa protected-access
+                expected[y, x] = symbol | attr
+
+    cells = cast(StubWindow, grid.win).cells
+    assert cells == expected
+
+    assert cells[0, 0] == curses.ACS_ULCORNER
+    assert cells[0, 5] == curses.ACS_HLINE
+    assert cells[0, 9] == curses.ACS_TTEE
+    assert cells[4, 9] == curses.ACS_PLUS
+    assert cells[12, 27] == curses.ACS_LRCORNER
+    assert cells[23, 79] == curses.ACS_LRCORNER  # lower-right corner of the window.
+    # highlighted right border of "a", between its corners.
+    assert cells[2, 9] == curses.ACS_VLINE | curses.A_REVERSE
+    assert cells[1, 9] == cells[3, 9] == curses.ACS_VLINE | curses.A_REVERSE
+    assert (2, 5) not in cells
+
+
+def _redraw(grid: Grid) -> bool:
+    """Redraw `grid`; return True if it rebuilt its map of border cells."""
+
+    layout = grid._layout  # noqa protected-access
+    grid.redraw()
+    return grid._layout is not layout  # noqa protected-access
+
+
+def test_redraw_rebuilds_after_box_moved(grid: Grid) -> None:
+    _build_vsplit(grid)
+    left, right = grid.boxes[1:]
+    assert _redraw(grid)
+    assert not _redraw(grid)
+
+    # drag the border between them one column left, as `_resize` does.
+    left.resize(22, 17)
+    right.mvwin(1, 19)
+    right.resize(22, 60)
+    assert _redraw(grid)
+
+    cells = cast(StubWindow, grid.win).cells
+    assert cells[5, 18] == curses.ACS_VLINE
+    assert (5, 19) not in cells
+
+
+def test_redraw_reuses_map_when_only_attrs_change(grid: Grid) -> None:
+    _build_vsplit(grid)
+    left = grid.boxes[1]
+    assert _redraw(grid)
+
+    grid.border_attr(left, Grid.N.R, True)
+    assert not _redraw(grid)
+    assert cast(StubWindow, grid.win).cells[5, 19] == curses.ACS_VLINE | curses.A_REVERSE
+
+    grid.border_attr(left, Grid.N.R, False)
+    assert not _redraw(grid)
+    assert cast(StubWindow, grid.win).cells[5, 19] == curses.ACS_VLINE
+
+
+def test_reset_forces_rebuild(grid: Grid) -> None:
+    _build_vsplit(grid)
+    assert _redraw(grid)
+    cells = dict(cast(StubWindow, grid.win).cells)
+
+    grid.reset()
+    _build_vsplit(grid)  # same layout as before.
+    assert _redraw(grid)
+    assert cast(StubWindow, grid.win).cells == cells
+
+
+def test_term_resized_forces_rebuild(grid: Grid, monkeypatch: pytest.MonkeyPatch) -> None:
+    # a builder whose layout does not depend on the size of the terminal.
+    grid.register_builder(lambda: _build_coordinates(grid))
+    assert _redraw(grid)
+
+    monkeypatch.setattr(curses, "LINES", 30, raising=False)
+    monkeypatch.setattr(curses, "COLS", 100, raising=False)
+    grid.handle_term_resized_event()
+    assert _redraw(grid)
+
+    cells = cast(StubWindow, grid.win).cells
+    assert cells[29, 99] == curses.ACS_LRCORNER
+    assert cells[29, 50] == curses.ACS_HLINE
+    assert (23, 50) not in cells
+    assert (23, 79) not in cells
@@ -0,0 +1,153 @@
+import curses
+import threading
+from typing import Callable, Iterator, cast
+
+import pytest
+from loguru import logger
+
+import libcurses.core
+import libcurses.logsink
+from libcurses.logsink import LogSink
+
+INFO = 0x100
+WARNING = 0x200
+
+
+class StubWindow:
+    """Enough of `curses.window` to log to without a terminal."""
+
+    def __init__(self) -> None:
+        self.y, self.x = 0, 0
+        self.written: list[tuple[str, int]] = []  # (text, attr) of each `addstr`.
+        self.noutrefreshes = 0
+        self.refreshes = 0
+
+    def getyx(self) -> tuple[int, int]:
+        return self.y, self.x
+
+    def move(self, y: int, x: int) -> None:
+        self.y, self.x = y, x
+
+    def addstr(self, text: str, attr: int = 0) -> None:
+        self.written.append((text, attr))
+        lines = text.split("\n")
+        self.y += len(lines) - 1
+        self.x = len(lines[-1]) if len(lines) > 1 else self.x + len(text)
+
+    def noutrefresh(self) -> None:
+        self.noutrefreshes += 1
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        # idlok, leaveok, scrollok, ...
+        return lambda *args: None
+
+
+@pytest.fixture(name="cursorwin")
+def fixture_cursorwin(monkeypatch: pytest.MonkeyPatch) -> StubWindow:
+    # the window `preserve_cursor` restores the cursor to, and refreshes.
+    win = StubWindow()
+    monkeypatch.setattr(libcurses.core, "CURSORWIN", win, raising=False)
+    monkeypatch.setattr(libcurses.core, "LOCK", threading.Lock(), raising=False)
+    return win
+
+
+@pytest.fixture(name="sink")
+def fixture_sink(monkeypatch: pytest.MonkeyPatch, cursorwin: StubWindow) -> Iterator[LogSink]:
+    _ = cursorwin
+    colormap = {"INFO": INFO, "WARNING": WARNING}
+    monkeypatch.setattr(libcurses.logsink, "get_colormap", lambda: colormap)
+    sink = LogSink(cast(curses.window, StubWindow()))
+    yield sink
+    sink.close()
+
+
+def _win(sink: LogSink) -> StubWindow:
+    return cast(StubWindow, sink.logwin)
+
+
+def test_writes_each_record_with_one_addstr(sink: LogSink) -> None:
+    sink._sink("12:34:56.789|mod:func:1|INFO|hello  \n")  # noqa protected-access
+    assert _win(sink).written == [("12:34:56.789|mod:func:1|INFO|hello", INFO)]
+
+
+def test_pads_columns_to_widest_so_far(sink: LogSink) -> None:
+    sink._sink("t1|a|INFO|one")  # noqa protected-access
+    sink._sink("t2|abc|WARNING|two")  # noqa protected-access
+    sink._sink("t3|a|INFO|three")  # noqa protected-access
+    assert [text for text, _ in _win(sink).written] == [
+        "t1|a|INFO|one",
+        "\nt2|abc|WARNING|two",
+        "\nt3|a  |INFO   |three",
+    ]
+    assert [attr for _, attr in _win(sink).written] == [INFO, WARNING, INFO]
+
+
+def test_omits_empty_location(sink: LogSink) -> None:
+    sink._sink("t1||INFO|one")  # noqa protected-access
+    assert _win(sink).written == [("t1|INFO|one", INFO)]
+
+
+def test_starts_new_line_only_when_cursor_is_not_at_origin(sink: LogSink) -> None:
+    win = _win(sink)
+    sink._sink("t1|a|INFO|one")  # noqa protected-access
+    sink._sink("t2|a|INFO|two")  # noqa protected-access
+    win.move(0, 0)
+    sink._sink("t3|a|INFO|three")  # noqa protected-access
+    assert [text for text, _ in win.written] == [
+        "t1|a|INFO|one",
+        "\nt2|a|INFO|two",
+        "t3|a|INFO|three",
+    ]
+
+
+def test_stages_window_and_updates_once(sink: LogSink, cursorwin: StubWindow) -> None:
+    sink._sink("t1|a|INFO|one")  # noqa protected-access
+    assert _win(sink).noutrefreshes == 1
+    assert _win(sink).refreshes == 0
+    # `preserve_cursor` does the one update, through the cursor's window.
+    assert cursorwin.refreshes == 1
+
+
+def test_unknown_level_short_circuits(sink: LogSink, cursorwin: StubWindow) -> None:
+    sink._sink("t1|abc|WARNING|one")  # noqa protected-access
+    win = _win(sink)
+    written, noutrefreshes = list(win.written), win.noutrefreshes
+    padding = sink._padloc, sink._padlev  # noqa protected-access
+
+    sink._sink("t2|abcdefgh|BOGUS-LEVEL|two")  # noqa protected-access
+    assert win.written == written
+    assert win.noutrefreshes == noutrefreshes
+    assert cursorwin.refreshes == 1
+    assert (sink._padloc, sink._padlev) == padding  # noqa protected-access
+
+
+def test_close_stops_logging(sink: LogSink) -> None:
+    sink.close()
+    logger.info("after close")
+    assert not _win(sink).written
+    sink.close()  # again, harmlessly.
+
+
+def test_enqueue_writes_from_worker_thread(
+    monkeypatch: pytest.MonkeyPatch, cursorwin: StubWindow
+) -> None:
+    monkeypatch.setattr(libcurses.logsink, "get_colormap", lambda: {"INFO": INFO})
+    win = StubWindow()
+    sink = LogSink(cast(curses.window, win), enqueue=True)
+    try:
+        # hold the lock `_sink` takes; only the worker thread waits on it.
+        with libcurses.core.LOCK:
+            logger.info("queued")
+            assert not win.written
+        logger.complete()
+        assert [text.rsplit("|", 1)[-1] for text, _ in win.written] == ["queued"]
+    finally:
+        sink.close()
+
+    logger.info("after close")
+    logger.complete()
+    assert len(win.written) == 1
+    assert cursorwin.refreshes == 1